@@ -0,0 +1,56 @@
+from collections.abc import AsyncIterator, Callable
+from typing import Any
+
+import httpx
+import pytest
+
+from tools_openverse.common import request as request_module
+from tools_openverse.common.request import SetRequest
+
+BASE_URL = "http://testserver"
+
+Handler = Callable[[httpx.Request], Any]
+
+
+@pytest.fixture(autouse=True)
+def base_prefix(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Resolve every service to BASE_URL so tests never read the settings.
+    """
+    monkeypatch.setattr(request_module, "_base_prefix", lambda service: BASE_URL)
+    monkeypatch.setattr(request_module, "_STATIC_URLS", {})
+
+
+@pytest.fixture
+def upstream() -> list[httpx.Request]:
+    """
+    Requests received by the mock transport, in arrival order.
+    """
+    return []
+
+
+@pytest.fixture
+async def make_client(
+    upstream: list[httpx.Request],
+) -> AsyncIterator[Callable[..., SetRequest]]:
+    """
+    Factory building SetRequest instances on top of a mock transport.
+
+    The handler receives each httpx.Request and returns an httpx.Response
+    (or a coroutine resolving to one); every request is recorded in upstream.
+    """
+    clients: list[httpx.AsyncClient] = []
+
+    def _make(handler: Handler, **kwargs: Any) -> SetRequest:
+        def _record(req: httpx.Request) -> Any:
+            upstream.append(req)
+            return handler(req)
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(_record))
+        clients.append(client)
+        return SetRequest(client=client, **kwargs)
+
+    yield _make
+
+    for client in clients:
+        await client.aclose()
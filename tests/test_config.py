@@ -0,0 +1,148 @@
+import asyncio
+import os
+import subprocess  # noqa: S404
+import sys
+import types
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+import pytest
+from redis.asyncio import Redis
+
+from tools_openverse.common import config
+from tools_openverse.common.config import close_redis, get_redis
+
+ENV = {
+    "PROJECT_NAME": "TEST",
+    "DATABASE_DB": "sqlite3",
+    "DATABASE_DRIVER": "sqlite+aiosqlite",
+    "DATABASE_FILE_NAME": "db.sqlite3",
+    "REDIS_HOST": "localhost",
+    "REDIS_PORT": "6379",
+    "JWT_ALGORITHM": "HS256",
+    "JWT_SECRET_KEY": "secret",
+    "OTHER_SERVICES": "USERS,AUTHETICATION",
+    "BASE_URL": "localhost/",
+    "PORT_SERVICE_USERS": "8001",
+}
+
+WriteEnv = Callable[[dict[str, str]], None]
+
+
+@pytest.fixture
+def write_env(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[WriteEnv]:
+    """
+    Write a .env file into an empty working directory.
+
+    The process environment and the cached .env snapshot are restored
+    afterwards, since load_dotenv writes straight into os.environ.
+    """
+    saved = dict(os.environ)
+    for key in ENV:
+        os.environ.pop(key, None)
+    monkeypatch.chdir(tmp_path)
+    config._load_env.cache_clear()
+    config._other_services.cache_clear()
+
+    def _write(values: dict[str, str]) -> None:
+        lines = (f"{key}={value}" for key, value in values.items())
+        (tmp_path / ".env").write_text("\n".join(lines), encoding="utf-8")
+
+    yield _write
+
+    os.environ.clear()
+    os.environ.update(saved)
+    config._load_env.cache_clear()
+    config._other_services.cache_clear()
+
+
+def test_settings_reads_dotenv(write_env: WriteEnv) -> None:
+    write_env(ENV)
+    settings = config.Settings()
+    assert settings.PROJECT_NAME == "TEST"
+    assert settings.BASE_URL == "http://localhost"
+    assert settings.REDIS_PORT == 6379
+    assert settings.redis_url == "redis://localhost:6379"
+
+
+def test_import_does_not_read_settings(tmp_path: Path) -> None:
+    # no .env and no settings in the environment: importing must still work
+    root = Path(__file__).resolve().parents[1]
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", "import tools_openverse"],
+        cwd=tmp_path,
+        env={"PATH": os.environ.get("PATH", ""), "PYTHONPATH": str(root)},
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert result.returncode == 0, result.stderr
+
+
+def test_alias_fallbacks(write_env: WriteEnv) -> None:
+    env = {key: value for key, value in ENV.items() if key != "PORT_SERVICE_USERS"}
+    env["PORT_SERVICE_TEST"] = "8003"
+    env["DATABASE_NAME"] = env.pop("DATABASE_DB")
+    write_env(env)
+    settings = config.Settings()
+    assert settings.DATABASE_DB == "sqlite3"
+    assert settings.PORT_SERVICE_USERS == "8003"
+
+
+@pytest.fixture
+def redis_settings(monkeypatch: pytest.MonkeyPatch) -> types.SimpleNamespace:
+    fake = types.SimpleNamespace(
+        REDIS_HOST="localhost",
+        REDIS_PORT=6379,
+        REDIS_PASSWORD=None,
+        REDIS_DB=None,
+        REDIS_MAX_CONNECTIONS=None,
+    )
+    monkeypatch.setattr(config, "get_settings", lambda: fake)
+    return fake
+
+
+@pytest.mark.usefixtures("redis_settings")
+def test_redis_client_per_loop() -> None:
+    async def use_redis() -> tuple[Redis, Redis]:
+        client = get_redis()
+        return client, get_redis()
+
+    first, again = asyncio.run(use_redis())
+    second, _ = asyncio.run(use_redis())
+    try:
+        assert first is again
+        assert second is not first
+        assert first not in config._REDIS_CLIENTS.values()
+    finally:
+        config._REDIS_CLIENTS.clear()
+
+
+@pytest.mark.usefixtures("redis_settings")
+async def test_close_redis() -> None:
+    client = get_redis()
+    await close_redis()
+    assert get_redis() is not client
+    await close_redis()
+    assert not config._REDIS_CLIENTS
+
+
+@pytest.mark.parametrize("max_connections", [None, 16])
+async def test_redis_pool_size(
+    redis_settings: types.SimpleNamespace, max_connections: int | None
+) -> None:
+    redis_settings.REDIS_MAX_CONNECTIONS = max_connections
+    pool = get_redis().connection_pool
+    await close_redis()
+    if max_connections is None:
+        # left to redis-py's own default
+        assert pool.max_connections > 16
+    else:
+        assert pool.max_connections == max_connections
+
+
+def test_base_dir_resolves_symlinks() -> None:
+    expected = Path(config.__file__).resolve()
+    for _ in range(6):
+        expected = expected.parent
+    assert config.Settings.model_fields["BASE_DIR"].default == expected
@@ -0,0 +1,26 @@
+import logging
+
+import pytest
+
+from tools_openverse.common.logger_ import setup_logger
+
+
+@pytest.mark.parametrize(
+    ("env_level", "expected"),
+    [
+        (None, logging.INFO),
+        ("DEBUG", logging.DEBUG),
+        ("warning", logging.WARNING),
+        ("verbose", logging.INFO),
+    ],
+)
+def test_level_from_env(
+    monkeypatch: pytest.MonkeyPatch, env_level: str | None, expected: int
+) -> None:
+    if env_level is None:
+        monkeypatch.delenv("LOG_LEVEL", raising=False)
+    else:
+        monkeypatch.setenv("LOG_LEVEL", env_level)
+    # loggers are cached per name, so each case needs its own
+    logger = setup_logger(f"test_logger.{env_level}")
+    assert logger.level == expected
@@ -0,0 +1,383 @@
+import asyncio
+import types
+from collections.abc import Callable
+from typing import Any
+
+import httpx
+import pytest
+from pydantic import BaseModel
+
+from tools_openverse.common import request as request_module
+from tools_openverse.common.request import (
+    BaseRequestException,
+    HttpMethods,
+    ServiceName,
+    SetRequest,
+    UsersRoutes,
+    close_http_client,
+    get_http_client,
+)
+from tools_openverse.common.types import (
+    ErrorResponse,
+    JSONResponseTypes,
+    SuccessResponse,
+)
+
+MakeClient = Callable[..., SetRequest]
+
+
+def ok(req: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json={"path": req.url.path})
+
+
+class FakeClock:
+    """Stands in for the time module inside request.py."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    fake = FakeClock()
+    # patch the module reference only; the event loop keeps the real clock
+    monkeypatch.setattr(
+        request_module, "time", types.SimpleNamespace(monotonic=fake.monotonic)
+    )
+    return fake
+
+
+async def get_health(
+    client: SetRequest, extra_params: dict[str, Any] | None = None
+) -> JSONResponseTypes:
+    return await client.send_request(
+        ServiceName.USERS,
+        UsersRoutes.HEALTH,
+        HttpMethods.GET,
+        extra_params=extra_params,
+    )
+
+
+class TestSharedClient:
+    async def test_reused_within_loop(self) -> None:
+        client = get_http_client()
+        assert get_http_client() is client
+        await close_http_client()
+        assert client.is_closed
+
+        # a closed client is replaced on next use
+        fresh = get_http_client()
+        assert fresh is not client
+        await close_http_client()
+
+    def test_one_client_per_loop(self) -> None:
+        async def use_client() -> httpx.AsyncClient:
+            return get_http_client()
+
+        first = asyncio.run(use_client())
+        second = asyncio.run(use_client())
+        try:
+            # the first client stays open but is bound to a finished loop
+            assert second is not first
+            assert not first.is_closed
+            assert first not in request_module._HTTP_CLIENTS.values()
+        finally:
+            request_module._HTTP_CLIENTS.clear()
+            for client in (first, second):
+                asyncio.run(client.aclose())
+
+
+class TestInjectedClient:
+    async def test_not_closed_on_exit(self, make_client: MakeClient) -> None:
+        request = make_client(ok, get_cache_ttl=60)
+        async with request:
+            await get_health(request)
+            assert request._get_cache
+        assert request._client is not None
+        assert not request._client.is_closed
+        assert not request._get_cache
+
+    async def test_closed_client_is_rejected(
+        self, make_client: MakeClient, upstream: list[httpx.Request]
+    ) -> None:
+        request = make_client(ok)
+        assert request._client is not None
+        await request._client.aclose()
+        with pytest.raises(RuntimeError, match="has been closed"):
+            await get_health(request)
+        assert not upstream
+
+
+class TestSendRequest:
+    @pytest.mark.parametrize(
+        ("status_code", "body", "expected"),
+        [
+            (
+                200,
+                {"id": 1},
+                SuccessResponse(detail={"id": 1}, success=True, status_code=200),
+            ),
+            (
+                201,
+                {"id": 2},
+                SuccessResponse(detail={"id": 2}, success=True, status_code=201),
+            ),
+            (
+                404,
+                {"detail": "missing"},
+                ErrorResponse(error="missing", status_code=404),
+            ),
+            (500, {}, ErrorResponse(error="HTTP 500 error", status_code=500)),
+            (503, ["down"], ErrorResponse(error="['down']", status_code=503)),
+        ],
+    )
+    async def test_wraps_response(
+        self,
+        make_client: MakeClient,
+        status_code: int,
+        body: Any,
+        expected: JSONResponseTypes,
+    ) -> None:
+        client = make_client(lambda req: httpx.Response(status_code, json=body))
+        assert await get_health(client) == expected
+
+    async def test_send_request_without_params_is_not_found(
+        self, make_client: MakeClient, upstream: list[httpx.Request]
+    ) -> None:
+        client = make_client(ok)
+        with pytest.raises(BaseRequestException) as exc_info:
+            await client.send_request(
+                ServiceName.USERS, UsersRoutes.GET_USER_BY_ID, HttpMethods.GET
+            )
+        assert exc_info.value.status_code == 404
+        assert not upstream
+
+
+class NewUser(BaseModel):
+    login: str
+    name: str | None = None
+
+
+class EmptyBody(BaseModel):
+    note: str | None = None
+
+
+class TestRequestBody:
+    async def test_json_body(
+        self, make_client: MakeClient, upstream: list[httpx.Request]
+    ) -> None:
+        client = make_client(ok)
+        await client.send_request(
+            ServiceName.USERS,
+            UsersRoutes.CREATE_USER,
+            HttpMethods.POST,
+            request_data=NewUser(login="bob"),
+        )
+        # None fields are left out, as with model_dump(exclude_none=True)
+        assert upstream[0].content == b'{"login":"bob"}'
+        assert upstream[0].headers["Content-Type"] == "application/json"
+
+    async def test_keeps_caller_content_type(
+        self, make_client: MakeClient, upstream: list[httpx.Request]
+    ) -> None:
+        client = make_client(ok)
+        await client.send_request(
+            ServiceName.USERS,
+            UsersRoutes.CREATE_USER,
+            HttpMethods.POST,
+            request_data=NewUser(login="bob"),
+            headers={"Content-Type": "application/vnd.api+json"},
+        )
+        assert upstream[0].headers["Content-Type"] == "application/vnd.api+json"
+
+    async def test_empty_model_sends_no_body(
+        self, make_client: MakeClient, upstream: list[httpx.Request]
+    ) -> None:
+        client = make_client(ok)
+        await client.send_request(
+            ServiceName.USERS,
+            UsersRoutes.CREATE_USER,
+            HttpMethods.POST,
+            request_data=EmptyBody(),
+        )
+        assert upstream[0].content == b""
+        assert "Content-Type" not in upstream[0].headers
+
+    async def test_form_body(
+        self, make_client: MakeClient, upstream: list[httpx.Request]
+    ) -> None:
+        client = make_client(ok)
+        await client.send_request(
+            ServiceName.USERS,
+            UsersRoutes.CREATE_USER,
+            HttpMethods.POST,
+            request_data=NewUser(login="bob"),
+            form_data=True,
+        )
+        assert upstream[0].content == b"login=bob"
+
+
+class TestDecodeBody:
+    async def test_empty_success_body(self, make_client: MakeClient) -> None:
+        client = make_client(lambda req: httpx.Response(204))
+        result = await get_health(client)
+        assert isinstance(result, SuccessResponse)
+        assert result.detail == {}
+        assert result.status_code == 204
+
+    @pytest.mark.parametrize("status_code", [200, 204])
+    async def test_invalid_success_body_is_bad_gateway(
+        self, make_client: MakeClient, status_code: int
+    ) -> None:
+        client = make_client(lambda req: httpx.Response(status_code, text="<html>"))
+        with pytest.raises(BaseRequestException) as exc_info:
+            await get_health(client)
+        assert exc_info.value.status_code == 502
+        assert "Failed to parse response JSON" in exc_info.value.detail
+
+    async def test_invalid_error_body_keeps_status(
+        self, make_client: MakeClient
+    ) -> None:
+        client = make_client(lambda req: httpx.Response(503, text="down"))
+        with pytest.raises(BaseRequestException) as exc_info:
+            await get_health(client)
+        assert exc_info.value.status_code == 503
+
+
+class TestGetCache:
+    async def test_hit(
+        self, make_client: MakeClient, upstream: list[httpx.Request]
+    ) -> None:
+        client = make_client(ok, get_cache_ttl=60)
+        first = await get_health(client)
+        second = await get_health(client)
+        assert isinstance(first, SuccessResponse)
+        assert second is first
+        assert len(upstream) == 1
+
+    async def test_disabled_by_default(
+        self, make_client: MakeClient, upstream: list[httpx.Request]
+    ) -> None:
+        client = make_client(ok)
+        await get_health(client)
+        await get_health(client)
+        assert len(upstream) == 2
+
+    async def test_keyed_by_query(
+        self, make_client: MakeClient, upstream: list[httpx.Request]
+    ) -> None:
+        client = make_client(ok, get_cache_ttl=60)
+        await get_health(client, extra_params={"a": 1, "b": 2})
+        await get_health(client, extra_params={"b": 2, "a": 1})
+        await get_health(client, extra_params={"a": 2})
+        assert len(upstream) == 2
+
+    async def test_expiry(
+        self,
+        make_client: MakeClient,
+        upstream: list[httpx.Request],
+        clock: FakeClock,
+    ) -> None:
+        client = make_client(ok, get_cache_ttl=5)
+        await get_health(client)
+        clock.now += 4
+        await get_health(client)
+        assert len(upstream) == 1
+        clock.now += 1
+        await get_health(client)
+        assert len(upstream) == 2
+
+    @pytest.mark.parametrize("cache_control", ["no-store", "private, no-cache"])
+    async def test_cache_control_opt_out(
+        self,
+        make_client: MakeClient,
+        upstream: list[httpx.Request],
+        cache_control: str,
+    ) -> None:
+        def handler(req: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200, json={}, headers={"Cache-Control": cache_control}
+            )
+
+        client = make_client(handler, get_cache_ttl=60)
+        await get_health(client)
+        await get_health(client)
+        assert len(upstream) == 2
+
+    async def test_error_responses_are_not_cached(
+        self, make_client: MakeClient, upstream: list[httpx.Request]
+    ) -> None:
+        def handler(req: httpx.Request) -> httpx.Response:
+            return httpx.Response(503, json={"detail": "down"})
+
+        client = make_client(handler, get_cache_ttl=60)
+        result = await get_health(client)
+        await get_health(client)
+        assert isinstance(result, ErrorResponse)
+        assert result.error == "down"
+        assert len(upstream) == 2
+
+    async def test_unserializable_query_is_not_cached(
+        self, make_client: MakeClient, upstream: list[httpx.Request]
+    ) -> None:
+        client = make_client(ok, get_cache_ttl=60)
+        query: Any = {1: "a"}  # orjson rejects non-string keys
+        for _ in range(2):
+            result = await get_health(client, extra_params=query)
+            assert isinstance(result, SuccessResponse)
+        assert len(upstream) == 2
+        assert upstream[0].url.query == b"1=a"
+
+    async def test_uncacheable_route(
+        self, make_client: MakeClient, upstream: list[httpx.Request]
+    ) -> None:
+        client = make_client(ok, get_cache_ttl=60)
+        for _ in range(2):
+            await client.send_request(
+                ServiceName.USERS,
+                UsersRoutes.GET_USER_BY_LOGIN,
+                HttpMethods.GET,
+                url_params={"user_login": "bob"},
+            )
+        assert len(upstream) == 2
+
+    async def test_evicts_oldest_at_maxsize(
+        self,
+        make_client: MakeClient,
+        upstream: list[httpx.Request],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(request_module, "_GET_CACHE_MAXSIZE", 2)
+        client = make_client(ok, get_cache_ttl=60)
+        for n in range(3):
+            await get_health(client, extra_params={"n": n})
+        assert len(client._get_cache) == 2
+
+        # n=1 and n=2 are still cached, n=0 was evicted
+        await get_health(client, extra_params={"n": 2})
+        await get_health(client, extra_params={"n": 1})
+        assert len(upstream) == 3
+        await get_health(client, extra_params={"n": 0})
+        assert len(upstream) == 4
+
+    async def test_sweeps_expired_before_evicting(
+        self,
+        make_client: MakeClient,
+        upstream: list[httpx.Request],
+        monkeypatch: pytest.MonkeyPatch,
+        clock: FakeClock,
+    ) -> None:
+        monkeypatch.setattr(request_module, "_GET_CACHE_MAXSIZE", 2)
+        client = make_client(ok, get_cache_ttl=60)
+        await get_health(client, extra_params={"n": 0})
+        client.get_cache_ttl = 1
+        await get_health(client, extra_params={"n": 1})
+        clock.now += 2  # the newer n=1 entry has expired, the oldest has not
+        await get_health(client, extra_params={"n": 2})
+
+        assert len(client._get_cache) == 2
+        await get_health(client, extra_params={"n": 0})
+        assert len(upstream) == 3
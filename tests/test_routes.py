@@ -0,0 +1,160 @@
+import types
+from collections.abc import Iterator
+
+import pytest
+
+from tools_openverse.common import request as request_module
+from tools_openverse.common.request import (
+    AuthenticationRoutes,
+    BaseRequestException,
+    HttpMethods,
+    RoutesNamespace,
+    RoutesTypes,
+    ServiceName,
+    SetRequest,
+    UsersRoutes,
+    _base_prefix,
+    _compile_route,
+    _service_ports,
+)
+
+
+class TestCompileRoute:
+    def test_static_template_has_no_formatter(self) -> None:
+        assert _compile_route("/users/create") is None
+
+    def test_substitutes_fields(self) -> None:
+        formatter = _compile_route("/users/{id}/tokens/{token}")
+        assert formatter is not None
+        assert formatter({"id": 7, "token": "abc"}) == "/users/7/tokens/abc"
+
+    def test_repeated_field(self) -> None:
+        formatter = _compile_route("/{id}/{id}")
+        assert formatter is not None
+        assert formatter({"id": "x"}) == "/x/x"
+
+    @pytest.mark.parametrize(
+        ("template", "params", "expected"),
+        [
+            ("/users/{id:>3}", {"id": 7}, "/users/  7"),
+            ("/users/{id!r}", {"id": "a"}, "/users/'a'"),
+            (
+                "/users/{user.id}",
+                {"user": types.SimpleNamespace(id=5)},
+                "/users/5",
+            ),
+        ],
+    )
+    def test_complex_fields_fall_back_to_format_map(
+        self, template: str, params: dict[str, object], expected: str
+    ) -> None:
+        formatter = _compile_route(template)
+        assert formatter is not None
+        assert formatter(params) == expected
+
+
+class TestGetRoute:
+    def test_formats_route_params(self) -> None:
+        route = RoutesNamespace.get_route(
+            ServiceName.USERS, UsersRoutes.GET_USER_BY_ID, {"id": 42}
+        )
+        assert route == "/users/get/42"
+
+    @pytest.mark.parametrize("params", [None, {}])
+    def test_missing_params(self, params: dict[str, object] | None) -> None:
+        with pytest.raises(ValueError, match="Missing parameters for route"):
+            RoutesNamespace.get_route(
+                ServiceName.USERS, UsersRoutes.GET_USER_BY_ID, params
+            )
+
+    def test_wrong_param_name(self) -> None:
+        with pytest.raises(ValueError, match=r"incorrect format: \['id'\]"):
+            RoutesNamespace.get_route(
+                ServiceName.USERS, UsersRoutes.GET_USER_BY_ID, {"user_id": 42}
+            )
+
+    def test_route_from_another_service(self) -> None:
+        with pytest.raises(ValueError, match="belongs to service AUTHENTICATION"):
+            RoutesNamespace.get_route(ServiceName.USERS, AuthenticationRoutes.LOG_IN)
+
+
+class TestValidateHttpMethod:
+    @pytest.mark.parametrize(
+        ("service", "route", "method"),
+        [
+            (ServiceName.USERS, UsersRoutes.CREATE_USER, HttpMethods.POST),
+            ("users", "HEALTH", HttpMethods.GET),
+            (ServiceName.AUTHENTICATION, AuthenticationRoutes.LOG_IN, HttpMethods.POST),
+            (None, AuthenticationRoutes.GET_USER_INFO, HttpMethods.GET),
+        ],
+    )
+    def test_accepts_expected_method(
+        self, service: ServiceName | str | None, route: RoutesTypes, method: HttpMethods
+    ) -> None:
+        SetRequest.validate_http_method(route, method, service)
+
+    @pytest.mark.parametrize("service", [ServiceName.USERS, None])
+    def test_method_mismatch(self, service: ServiceName | None) -> None:
+        with pytest.raises(ValueError, match="Invalid HTTP method GET"):
+            SetRequest.validate_http_method(
+                UsersRoutes.CREATE_USER, HttpMethods.GET, service
+            )
+
+    def test_unknown_service(self) -> None:
+        with pytest.raises(BaseRequestException) as exc_info:
+            SetRequest.validate_http_method("HEALTH", HttpMethods.GET, "FOO")
+        assert exc_info.value.status_code == 404
+        assert exc_info.value.detail == "Unknown service: FOO"
+
+    def test_route_missing_from_service(self) -> None:
+        # declared in _HttpRoutesMethods, but no service exposes it
+        with pytest.raises(BaseRequestException) as exc_info:
+            SetRequest.validate_http_method(
+                "GET_ACCESS_TOKEN", HttpMethods.GET, ServiceName.AUTHENTICATION
+            )
+        assert exc_info.value.status_code == 404
+        assert exc_info.value.detail == (
+            "Route GET_ACCESS_TOKEN not found for service AUTHENTICATION"
+        )
+
+    def test_unknown_route_without_service(self) -> None:
+        with pytest.raises(BaseRequestException) as exc_info:
+            SetRequest.validate_http_method(
+                "NOPE", HttpMethods.GET  # type: ignore[arg-type]
+            )
+        assert exc_info.value.status_code == 404
+
+    def test_route_from_another_service(self) -> None:
+        with pytest.raises(BaseRequestException) as exc_info:
+            SetRequest.validate_http_method(
+                AuthenticationRoutes.LOG_IN, HttpMethods.POST, ServiceName.USERS
+            )
+        assert exc_info.value.status_code == 404
+        assert "belongs to service AUTHENTICATION" in str(exc_info.value.detail)
+
+
+class TestBasePrefix:
+    @pytest.fixture
+    def settings(self, monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+        fake = types.SimpleNamespace(
+            BASE_URL="http://upstream", PORT_SERVICE_USERS=8001, PORT_SERVICE_AUTH=None
+        )
+        monkeypatch.setattr(request_module, "get_settings", lambda: fake)
+        _service_ports.cache_clear()
+        _base_prefix.cache_clear()
+        yield
+        _service_ports.cache_clear()
+        _base_prefix.cache_clear()
+
+    @pytest.mark.usefixtures("settings")
+    def test_joins_service_port(self) -> None:
+        assert _base_prefix("USERS") == "http://upstream:8001"
+
+    @pytest.mark.usefixtures("settings")
+    def test_service_without_port(self) -> None:
+        assert _base_prefix("AUTHENTICATION") == "http://upstream"
+
+    @pytest.mark.usefixtures("settings")
+    def test_unknown_service(self) -> None:
+        with pytest.raises(KeyError):
+            _base_prefix("FOO")
@@ -0,0 +1,93 @@
+import asyncio
+from collections.abc import Callable
+
+import httpx
+import pytest
+
+from tools_openverse.common.request import (
+    HttpMethods,
+    RequestSpec,
+    ServiceName,
+    SetRequest,
+    UsersRoutes,
+)
+from tools_openverse.common.types import SuccessResponse
+
+MakeClient = Callable[..., SetRequest]
+
+
+def ok(req: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json={"path": req.url.path})
+
+
+def spec(user_id: int) -> RequestSpec:
+    return {
+        "service_name": ServiceName.USERS,
+        "route_name": UsersRoutes.GET_USER_BY_ID,
+        "route_method": HttpMethods.GET,
+        "url_params": {"id": user_id},
+    }
+
+
+# GET_USER_BY_ID only accepts GET, so this spec fails validation
+BAD_SPEC: RequestSpec = {**spec(1), "route_method": HttpMethods.POST}
+
+
+async def test_keeps_spec_order(make_client: MakeClient) -> None:
+    async def handler(req: httpx.Request) -> httpx.Response:
+        user_id = int(req.url.path.rsplit("/", 1)[1])
+        # later specs answer first
+        await asyncio.sleep((5 - user_id) * 0.01)
+        return httpx.Response(200, json={"id": user_id})
+
+    client = make_client(handler)
+    results = await client.send_many(spec(n) for n in range(5))
+    assert [r.detail["id"] for r in results if isinstance(r, SuccessResponse)] == [
+        0,
+        1,
+        2,
+        3,
+        4,
+    ]
+
+
+async def test_raises_first_failure(make_client: MakeClient) -> None:
+    client = make_client(ok)
+    with pytest.raises(ValueError, match="Invalid HTTP method"):
+        await client.send_many([spec(0), BAD_SPEC])
+
+
+async def test_max_concurrency(make_client: MakeClient) -> None:
+    in_flight = peak = 0
+
+    async def handler(req: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json={})
+
+    client = make_client(handler)
+    results = await client.send_many([spec(n) for n in range(6)], max_concurrency=2)
+    assert len(results) == 6
+    assert peak == 2
+
+
+@pytest.mark.parametrize("max_concurrency", [0, -1])
+async def test_rejects_max_concurrency_below_one(
+    make_client: MakeClient, max_concurrency: int
+) -> None:
+    client = make_client(ok)
+    with pytest.raises(ValueError, match="max_concurrency"):
+        await client.send_many([spec(1)], max_concurrency=max_concurrency)
+
+
+async def test_return_exceptions(make_client: MakeClient) -> None:
+    client = make_client(ok)
+    results = await client.send_many(
+        [spec(0), BAD_SPEC, spec(2)], return_exceptions=True
+    )
+    assert isinstance(results[0], SuccessResponse)
+    assert isinstance(results[1], ValueError)
+    assert isinstance(results[2], SuccessResponse)
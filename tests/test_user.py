@@ -0,0 +1,58 @@
+import types
+from datetime import datetime
+from uuid import uuid4
+
+from pydantic import BaseModel
+
+from tools_openverse.common.abc.user import AbstractUser
+
+
+class User(AbstractUser):
+    def change_password(self, new_password: str) -> None:
+        self.password = new_password
+
+
+NOW = datetime(2025, 1, 1)
+ROW = {
+    "id": uuid4(),
+    "login": "bob",
+    "name": "Bob",
+    "password": "hash",
+    "email": "bob@example.com",
+    "is_active": True,
+    "created_at": NOW,
+    "updated_at": NOW,
+}
+
+
+def test_from_row_mapping() -> None:
+    user = User.from_row(ROW)
+    assert isinstance(user, User)
+    assert user.model_dump() == ROW
+
+
+def test_from_row_attributes() -> None:
+    orm_row = types.SimpleNamespace(**ROW, unrelated="ignored")
+    user = User.from_row(orm_row)
+    assert user.model_dump() == ROW
+
+
+def test_from_row_skips_validation() -> None:
+    # trusted rows are taken as is, e.g. a raw string timestamp is not parsed
+    user = User.from_row({**ROW, "created_at": "2025-01-01"})
+    assert user.created_at == "2025-01-01"
+
+
+def test_build_trusted() -> None:
+    user = User.build_trusted(**ROW)
+    assert isinstance(user, User)
+    assert user.login == "bob"
+    assert user.model_fields_set == set(ROW)
+
+
+def test_nested_user_is_not_revalidated() -> None:
+    class Session(BaseModel):
+        user: User
+
+    user = User.from_row({**ROW, "created_at": "2025-01-01"})
+    assert Session(user=user).user is user
@@ -1,30 +1,65 @@
-from tools_openverse.common.config import get_redis, settings
+from tools_openverse.common.abc.user import AbstractUser
+from tools_openverse.common.config import Settings, close_redis, get_redis, get_settings
 from tools_openverse.common.logger_ import setup_logger
 from tools_openverse.common.request import (
     AuthenticationRoutes,
     BaseRequestException,
     HttpMethods,
+    RequestSpec,
     ServiceName,
     SetRequest,
     UsersRoutes,
+    close_http_client,
+    get_http_client,
+)
+from tools_openverse.common.types import (
+    AccessTokenType,
+    ErrorResponse,
+    RefreshTokenType,
+    SuccessResponse,
 )
-from tools_openverse.common.types import AccessTokenType, ErrorResponse, RefreshTokenType, SuccessResponse
-from tools_openverse.common.abc.user import AbstractUser
 
+# Built on first access by __getattr__ below
+settings: Settings
 
 __all__ = [
     "SetRequest",
     "setup_logger",
     "settings",
     "get_redis",
+    "close_redis",
+    "get_http_client",
+    "close_http_client",
     "ServiceName",
     "UsersRoutes",
     "AuthenticationRoutes",
     "HttpMethods",
+    "RequestSpec",
     "SuccessResponse",
     "ErrorResponse",
     "BaseRequestException",
     "AbstractUser",
     "AccessTokenType",
-    "RefreshTokenType"
+    "RefreshTokenType",
 ]
+
+
+def __getattr__(name: str) -> Settings:
+    """
+    Resolve the package-level settings attribute lazily (PEP 562).
+
+    Importing the package does not load the .env file or validate the
+    configuration; that happens the first time settings is read.
+
+    Args:
+        name (str): Name of the requested module attribute
+
+    Returns:
+        Settings: Cached settings instance
+
+    Raises:
+        AttributeError: If any other unknown attribute is requested
+    """
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
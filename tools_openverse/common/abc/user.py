@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
+from typing import Any, Self
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from tools_openverse.common.types import (
     CreatedAtType,
@@ -26,9 +28,40 @@ class AbstractUser(ABC, BaseModel):
     created_at: CreatedAtType
     updated_at: UpdatedAtType
 
-    class Config:
-        arbitrary_types_allowed = True
-        from_attributes = True
+    model_config = ConfigDict(
+        arbitrary_types_allowed=True,
+        from_attributes=True,
+        validate_assignment=False,
+        extra="ignore",
+        frozen=False,
+        # pydantic's default, spelled out: user instances nested in other
+        # models are passed through as is rather than validated again
+        revalidate_instances="never",
+    )
+
+    @classmethod
+    def build_trusted(cls, **data: Any) -> Self:
+        """
+        Build a user from already validated data without running validation.
+
+        Only for internal service-to-service payloads that were validated
+        upstream; untrusted input must go through the regular constructor.
+        """
+        return cls.model_construct(**data)  # type: ignore[return-value]
+
+    @classmethod
+    def from_row(cls, row: Any) -> Self:
+        """
+        Hydrate a user from a database row without running validation.
+
+        Accepts a mapping or an ORM object exposing the fields as attributes.
+        Only for rows that were written through validated models.
+        """
+        if isinstance(row, Mapping):
+            return cls.build_trusted(**row)
+        return cls.build_trusted(
+            **{name: getattr(row, name) for name in cls.model_fields}
+        )
 
     @abstractmethod
     def change_password(self, new_password: str) -> None:
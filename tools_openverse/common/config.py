@@ -6,38 +6,65 @@ and environment variable loading. It supports multiple databases
 (SQLite, PostgreSQL) and Redis configuration.
 """
 
+import asyncio
+import functools
 import logging
 import os
 from pathlib import Path
 from typing import Any, ClassVar, Optional
 
 from dotenv import find_dotenv, load_dotenv
-from pydantic import Field, field_validator, model_validator
-from pydantic_settings import BaseSettings
-from redis.asyncio import Redis, from_url  # pyright: ignore
+from pydantic import AliasChoices, Field, PrivateAttr, field_validator, model_validator
+from pydantic_settings import (
+    BaseSettings,
+    EnvSettingsSource,
+    PydanticBaseSettingsSource,
+    SettingsConfigDict,
+)
+from redis.asyncio import ConnectionPool, Redis  # pyright: ignore
 
 from tools_openverse.common.logger_ import setup_logger
 
 logger = setup_logger("config")
 
-# Load environment variables from .env file
-load_dotenv(find_dotenv(filename=".env", raise_error_if_not_found=True))
+# Project base directory: six levels above this file, clamped at the root
+_HERE = os.path.dirname(os.path.realpath(__file__))
+_BASE_DIR = Path(os.path.normpath(os.path.join(_HERE, *[os.pardir] * 5)))
 
 
-def get_env_value(key: str) -> Any:
+@functools.cache
+def _load_env() -> dict[str, str]:
     """
-    Get environment variable value.
+    Load the .env file and snapshot the environment, once.
 
-    Args:
-        key (str): Environment variable name
+    The .env file is searched for from the working directory on first call,
+    so importing this module neither reads nor requires it.
 
     Returns:
-        Any: Environment variable value or None if not found
+        dict[str, str]: Environment variables after .env has been loaded
+
+    Raises:
+        IOError: If no .env file is found
     """
-    result = os.getenv(key)
-    if not result:
-        return None
-    return result
+    env_path = find_dotenv(filename=".env", raise_error_if_not_found=True, usecwd=True)
+    load_dotenv(env_path)
+    logger.debug("Loaded environment from %s", env_path)
+    return dict(os.environ)
+
+
+@functools.cache
+def _other_services() -> frozenset[str]:
+    """
+    Names listed in the OTHER_SERVICES environment variable.
+
+    Returns:
+        frozenset[str]: Service names, stripped of whitespace
+    """
+    return frozenset(
+        service.strip()
+        for service in _load_env().get("OTHER_SERVICES", "").split(",")
+        if service.strip()
+    )
 
 
 class Settings(BaseSettings):
@@ -58,51 +85,115 @@ class Settings(BaseSettings):
         SESSION_TTL (int): Session time-to-live in seconds
     """
 
+    model_config = SettingsConfigDict(case_sensitive=True)
+
     # Basic application settings
-    PROJECT_NAME: str = get_env_value("PROJECT_NAME")
-    DEBUG: bool = get_env_value("DEBUG")
+    PROJECT_NAME: str
+    DEBUG: bool = False
 
     # Paths
-    BASE_DIR: Path = Path(__file__).parent.parent.parent.parent.parent.parent
+    BASE_DIR: Path = _BASE_DIR
 
     # Database configuration
     ALLOWED_DATABASES: ClassVar[list[str]] = ["sqlite3", "postgresql"]
 
-    DATABASE_DB: str = get_env_value("DATABASE_NAME")
-    DATABASE_DRIVER: str = get_env_value("DATABASE_DRIVER")
+    # Fields never written to logs
+    SENSITIVE_FIELDS: ClassVar[frozenset[str]] = frozenset(
+        {"JWT_SECRET_KEY", "REDIS_PASSWORD"}
+    )
+
+    # Falls back to DATABASE_NAME when DATABASE_DB is not set
+    DATABASE_DB: str = Field(
+        validation_alias=AliasChoices("DATABASE_DB", "DATABASE_NAME")
+    )
+    DATABASE_DRIVER: str
     DATABASE_POOL_SIZE: int = 5
     DATABASE_MAX_OVERFLOW: int = 10
-    DATABASE_HOST: Optional[str] = get_env_value("DATABASE_HOST")
-    DATABASE_PORT: Optional[str] = get_env_value("DATABASE_PORT")
-    DATABASE_USER: Optional[str] = get_env_value("DATABASE_USER")
-    DATABASE_PASSWORD: Optional[str] = get_env_value("DATABASE_PASSWORD")
-    DATABASE_FILE_NAME: Optional[str] = get_env_value("DATABASE_FILE_NAME")
-    DATABASE_NAME: Optional[str] = get_env_value("DATABASE_NAME")
+    DATABASE_HOST: Optional[str] = None
+    DATABASE_PORT: Optional[str] = None
+    DATABASE_USER: Optional[str] = None
+    DATABASE_PASSWORD: Optional[str] = None
+    DATABASE_FILE_NAME: Optional[str] = None
+    DATABASE_NAME: Optional[str] = None
 
     # Redis configuration
-    REDIS_HOST: str = get_env_value("REDIS_HOST")
-    REDIS_PORT: int = get_env_value("REDIS_PORT")
-    REDIS_DB: Optional[int] = get_env_value("REDIS_DB")
-    REDIS_PASSWORD: Optional[str] = get_env_value("REDIS_PASSWORD")
+    REDIS_HOST: str
+    REDIS_PORT: int
+    REDIS_DB: Optional[int] = None
+    REDIS_PASSWORD: Optional[str] = None
+    # Upper bound on pooled Redis connections; None keeps redis-py's default
+    REDIS_MAX_CONNECTIONS: Optional[int] = None
 
     # JWT Settings
-    JWT_ALGORITHM: str = get_env_value("JWT_ALGORITHM")
-    JWT_SECRET_KEY: str = get_env_value("JWT_SECRET_KEY")
+    JWT_ALGORITHM: str
+    JWT_SECRET_KEY: str
 
     # Service configuration
     ALL_SERVICES: ClassVar[list[str]] = ["USERS, AUTHETICATION, TEST"]
-    OTHER_SERVICES: str = get_env_value("OTHER_SERVICES")
-    BASE_URL: str = get_env_value("BASE_URL")
+    OTHER_SERVICES: str
+    BASE_URL: str
     PORT_SERVICE: str | int | None = Field(default=None)
 
-    PORT_SERVICE_AUTH: str | int | None = get_env_value("PORT_SERVICE_AUTH")
-    PORT_SERVICE_USERS: str | int | None = get_env_value("PORT_SERVICE_TEST")
+    PORT_SERVICE_AUTH: str | int | None = None
+    # Falls back to PORT_SERVICE_TEST when PORT_SERVICE_USERS is not set
+    PORT_SERVICE_USERS: str | int | None = Field(
+        default=None,
+        validation_alias=AliasChoices("PORT_SERVICE_USERS", "PORT_SERVICE_TEST"),
+    )
 
     # Session configuration
     SESSION_TTL: int = 3600  # Session time-to-live in seconds (1 hour)
 
-    @property
-    def database_url(self) -> Optional[str]:
+    # Connection URLs, built once in model_post_init
+    _database_url: Optional[str] = PrivateAttr(default=None)
+    _redis_url: str = PrivateAttr(default="")
+
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls: type[BaseSettings],
+        init_settings: PydanticBaseSettingsSource,
+        env_settings: PydanticBaseSettingsSource,
+        dotenv_settings: PydanticBaseSettingsSource,
+        file_secret_settings: PydanticBaseSettingsSource,
+    ) -> tuple[PydanticBaseSettingsSource, ...]:
+        """
+        Load the .env file before the settings sources are read.
+
+        Keeps the .env lookup out of import time while still letting a direct
+        Settings() call see the values declared there. The environment source
+        is rebuilt afterwards, since it snapshots os.environ when created.
+
+        Args:
+            settings_cls (type[BaseSettings]): Settings class being built
+            init_settings (PydanticBaseSettingsSource): Constructor arguments
+            env_settings (PydanticBaseSettingsSource): Environment variables
+            dotenv_settings (PydanticBaseSettingsSource): dotenv file source
+            file_secret_settings (PydanticBaseSettingsSource): Secrets directory
+
+        Returns:
+            tuple[PydanticBaseSettingsSource, ...]: Sources in priority order
+        """
+        _load_env()
+        return (
+            init_settings,
+            EnvSettingsSource(settings_cls),
+            dotenv_settings,
+            file_secret_settings,
+        )
+
+    def model_post_init(self, context: Any, /) -> None:
+        """
+        Precompute the connection URLs once the fields are validated.
+
+        Args:
+            context (Any): Validation context passed by pydantic
+        """
+        self._database_url = self._build_database_url()
+        auth_part = f":{self.REDIS_PASSWORD}@" if self.REDIS_PASSWORD else ""
+        self._redis_url = f"redis://{auth_part}{self.REDIS_HOST}:{self.REDIS_PORT}"
+
+    def _build_database_url(self) -> Optional[str]:
         """
         Generate database connection URL based on database type.
 
@@ -130,22 +221,29 @@ class Settings(BaseSettings):
                 f"/{self.DATABASE_NAME}"
             )
 
-            logger.debug(f"Formed database URL: {url}")
+            logger.debug("Formed database URL: %s", url)
             return url
         raise ValueError(f"Unsupported database: {self.DATABASE_DB}")
 
     @property
-    def redis_url(self) -> str:
+    def database_url(self) -> Optional[str]:
+        """
+        Database connection URL, precomputed from the database settings.
+
+        Returns:
+            Optional[str]: Database connection URL or None if invalid config
         """
-        Generate Redis connection URL.
+        return self._database_url
 
-        Creates a Redis URL with optional password authentication.
+    @property
+    def redis_url(self) -> str:
+        """
+        Redis connection URL with optional password authentication.
 
         Returns:
             str: Redis connection URL in format redis://[password@]host:port
         """
-        auth_part = f":{self.REDIS_PASSWORD}@" if self.REDIS_PASSWORD else ""
-        return f"redis://{auth_part}{self.REDIS_HOST}:{self.REDIS_PORT}"
+        return self._redis_url
 
     def log_settings(self, logger_: logging.Logger) -> None:
         """
@@ -154,9 +252,12 @@ class Settings(BaseSettings):
         Args:
             logger_ (logging.Logger): Logger instance to use for output
         """
-        settings_dict = self.to_dict()
-        for key, value in settings_dict.items():
-            logger_.info(f"{key}: {value}")
+        if not logger_.isEnabledFor(logging.INFO):
+            return
+        logger_.info(
+            "Settings:\n%s",
+            "\n".join(f"  {key}: {value}" for key, value in self.to_dict().items()),
+        )
 
     def to_dict(self) -> dict[str, Any]:
         """
@@ -165,7 +266,12 @@ class Settings(BaseSettings):
         Returns:
             dict[str, Any]: Settings dictionary without sensitive data
         """
-        return self.model_dump(exclude={"JWT_SECRET_KEY", "REDIS_PASSWORD"})
+        # Iterate declared fields only, so derived values never reach the logs
+        return {
+            key: getattr(self, key)
+            for key in type(self).model_fields
+            if key not in self.SENSITIVE_FIELDS
+        }
 
     @field_validator("PROJECT_NAME")
     @classmethod
@@ -182,18 +288,33 @@ class Settings(BaseSettings):
         Raises:
             ValueError: If project name is not in allowed services list
         """
-        other_services = os.getenv("OTHER_SERVICES", "").split(", ")
-
-        if not other_services:
-            raise ValueError("OTHER_SERVICES environment variable is empty or not set")
-
-        if value in other_services:
+        other_services = _other_services()
+        if other_services and value in other_services:
             raise ValueError(
-                f"PROJECT_NAME '{value}' must be one of: {', '.join(other_services)}"
+                f"PROJECT_NAME '{value}' must be one of: "
+                f"{', '.join(sorted(other_services))}"
             )
 
         return value
 
+    @field_validator("BASE_URL")
+    @classmethod
+    def validate_base_url(cls, value: str) -> str:
+        """
+        Normalize BASE_URL to a scheme-qualified URL without a trailing slash.
+
+        Args:
+            value (str): Base URL, with or without an http(s) scheme
+
+        Returns:
+            str: Base URL prefixed with http:// if it had no scheme and with
+            trailing slashes removed
+        """
+        if not value.startswith(("http://", "https://")):
+            value = f"http://{value}"
+
+        return value.rstrip("/")
+
     @field_validator("DATABASE_DB")
     @classmethod
     def validate_database_name(cls, value: str) -> str:
@@ -225,14 +346,15 @@ class Settings(BaseSettings):
                 "DATABASE_USER",
                 "DATABASE_PASSWORD",
             ]
-            missing_vars = [var for var in required_vars if not os.getenv(var)]
+            env = _load_env()
+            missing_vars = [var for var in required_vars if not env.get(var)]
             if missing_vars:
                 raise ValueError(
                     f"Missing required environment variables for PostgreSQL: {
                         ', '.join(missing_vars)}"
                 )
         elif value == "sqlite3":
-            if not os.getenv("DATABASE_FILE_NAME"):
+            if not _load_env().get("DATABASE_FILE_NAME"):
                 raise ValueError("Missing DATABASE_FILE_NAME for SQLite")
 
         return value
@@ -279,41 +401,121 @@ class Settings(BaseSettings):
         return values
 
 
+_settings: Optional[Settings] = None  # pylint: disable=invalid-name
+
+
 def get_settings() -> Settings:
     """
     Create and return application settings instance.
 
-    This function creates a Settings instance, logs all configuration
-    values, and returns the configured settings object.
+    This function creates a Settings instance, which loads the .env file,
+    logs all configuration values, and returns the configured settings object.
+    The instance is kept in a module global, so repeated calls return the same
+    object.
 
     Returns:
         Settings: Configured and validated settings instance
     """
-    settings_ = Settings()
-    settings_.log_settings(logger)
+    global _settings  # pylint: disable=global-statement
+    settings_ = _settings
+    if settings_ is None:
+        settings_ = _settings = Settings()
+        settings_.log_settings(logger)
     return settings_
 
 
-# Export settings instance for use in other modules
-settings = get_settings()
+def __getattr__(name: str) -> Settings:
+    """
+    Resolve the module-level settings attribute lazily (PEP 562).
+
+    The Settings instance is only built the first time settings is read,
+    so importing this module does not validate the configuration.
+
+    Args:
+        name (str): Name of the requested module attribute
+
+    Returns:
+        Settings: Cached settings instance
+
+    Raises:
+        AttributeError: If any other unknown attribute is requested
+    """
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Redis clients, one per event loop: pooled connections are bound to the loop
+# that opened them and cannot be reused once that loop is closed
+_REDIS_CLIENTS: dict[Optional[asyncio.AbstractEventLoop], Redis] = {}
+
+
+def _current_loop() -> Optional[asyncio.AbstractEventLoop]:
+    """
+    Returns the running event loop, or None when called outside of one.
+    """
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
 
 
 def get_redis() -> Redis:
     """
-    Create and return Redis connection.
+    Return the Redis connection of the running event loop.
 
-    Creates an asynchronous Redis connection using the configuration
-    settings. The connection is configured with UTF-8 encoding and
-    response decoding enabled.
+    The asynchronous Redis client is created on first call in each event loop
+    on top of a connection pool built from the REDIS_* settings, with UTF-8
+    encoding and response decoding enabled. Later calls in the same loop
+    return the same client, so connections are reused instead of opening a
+    new pool; a new loop (e.g. per asyncio.run() call or per test) gets its
+    own client.
 
     Returns:
-        Redis: Configured async Redis connection instance
+        Redis: Shared async Redis client instance
 
     Example:
-        >>> redis_client = await get_redis()
+        >>> redis_client = get_redis()
         >>> await redis_client.set("key", "value")
         >>> value = await redis_client.get("key")
     """
-    return from_url(  # type: ignore
-        settings.redis_url, decode_responses=True, encoding="utf-8"
-    )
+    loop = _current_loop()
+    client = _REDIS_CLIENTS.get(loop)
+    if client is None:
+        # forget clients of loops that have been closed since
+        for stale_loop in [
+            other for other in _REDIS_CLIENTS if other is not None and other.is_closed()
+        ]:
+            del _REDIS_CLIENTS[stale_loop]
+        settings_ = get_settings()
+        pool = ConnectionPool(
+            host=settings_.REDIS_HOST,
+            port=settings_.REDIS_PORT,
+            password=settings_.REDIS_PASSWORD or None,
+            db=settings_.REDIS_DB or 0,
+            decode_responses=True,
+            encoding="utf-8",
+            max_connections=settings_.REDIS_MAX_CONNECTIONS,
+        )
+        client = _REDIS_CLIENTS[loop] = Redis(connection_pool=pool)
+    return client
+
+
+async def close_redis() -> None:
+    """
+    Close the Redis client of the running event loop and disconnect its pool.
+
+    Meant to be awaited on application shutdown (e.g. in a FastAPI lifespan).
+    Does nothing if get_redis() was never called in this loop; a later
+    get_redis() call creates a fresh client.
+
+    Example:
+        >>> @asynccontextmanager
+        ... async def lifespan(app: FastAPI):
+        ...     yield
+        ...     await close_redis()
+    """
+    client = _REDIS_CLIENTS.pop(_current_loop(), None)
+    if client is None:
+        return
+    await client.aclose(close_connection_pool=True)
@@ -2,35 +2,37 @@
 This module provides a logger setup utility for the OpenVerse tools package.
 It configures a logger with both file and console handlers, using a rotating file
 handler for persistent logging and a stream handler for console output.
+Records are handed to the handlers by a background listener thread, so the
+calling code only enqueues them.
 """
 
+import atexit
+import functools
 import logging
+import os
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 
+_FORMATTER = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 
-def setup_logger(name: str = __name__) -> logging.Logger:
+
+@functools.cache
+def _get_log_queue() -> queue.SimpleQueue[logging.LogRecord]:
     """
-    Set up and return a configured logger instance.
+    Build the shared handlers once and start the listener that feeds them.
 
-    The logger writes DEBUG and higher level logs to a rotating file in the 'logs'
-    directory, and INFO and higher level logs to the console (stdout).
-
-    Args:
-        name (str): The name of the logger. Defaults to the module's __name__.
+    Every logger configured by setup_logger enqueues into the returned queue,
+    so all of them share one rotating file handler, one console handler and
+    one listener thread.
 
     Returns:
-        logging.Logger: Configured logger instance.
+        queue.SimpleQueue[logging.LogRecord]: Queue drained by the listener.
     """
     log_dir = Path("logs")
     log_dir.mkdir(exist_ok=True)
 
-    logger__ = logging.getLogger(name)
-    logger__.setLevel(logging.DEBUG)
-
-    formater = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-
     file_handler = RotatingFileHandler(
         log_dir / "app.log",
         maxBytes=5_000_000,
@@ -38,13 +40,61 @@ def setup_logger(name: str = __name__) -> logging.Logger:
         encoding="utf-8",
     )
     file_handler.setLevel(logging.DEBUG)
-    file_handler.setFormatter(formater)
+    file_handler.setFormatter(_FORMATTER)
 
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(logging.INFO)
-    console_handler.setFormatter(formater)
+    console_handler.setFormatter(_FORMATTER)
+
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    listener = QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
+
+    return log_queue
+
+
+def _log_level() -> int:
+    """
+    Level of the loggers configured by setup_logger.
+
+    Read from the LOG_LEVEL environment variable (e.g. "DEBUG"), so the
+    isEnabledFor(DEBUG) guards on hot paths skip their work by default.
+
+    Returns:
+        int: Logging level; INFO if LOG_LEVEL is unset or not a level name.
+    """
+    name = os.environ.get("LOG_LEVEL", "INFO").strip().upper()
+    return logging.getLevelNamesMapping().get(name, logging.INFO)
+
+
+@functools.cache
+def setup_logger(name: str = __name__) -> logging.Logger:
+    """
+    Set up and return a configured logger instance.
+
+    The logger level comes from the LOG_LEVEL environment variable and
+    defaults to INFO. Records at that level and above are written to a
+    rotating file in the 'logs' directory, and INFO and higher level logs to
+    the console (stdout). Both
+    handlers are shared by all loggers and run on one QueueListener thread;
+    the logger itself only has a QueueHandler attached. Results are cached
+    per name, and a logger that already has handlers is returned without
+    adding more.
+
+    Args:
+        name (str): The name of the logger. Defaults to the module's __name__.
+
+    Returns:
+        logging.Logger: Configured logger instance.
+    """
+    logger__ = logging.getLogger(name)
+    if logger__.handlers:
+        return logger__
 
-    logger__.addHandler(file_handler)
-    logger__.addHandler(console_handler)
+    logger__.setLevel(_log_level())
+    logger__.addHandler(QueueHandler(_get_log_queue()))
 
     return logger__
@@ -4,14 +4,34 @@ Provides type-safe route management and request
 handling with automatic URL construction.
 """
 
-from enum import Enum
-from typing import Any, Optional, Type, Union
+import asyncio
+import functools
+import logging
+import string
+import time
+from collections.abc import Callable, Iterable, Mapping
+from enum import StrEnum, unique
+from types import TracebackType
+from typing import (
+    Any,
+    Literal,
+    NamedTuple,
+    NotRequired,
+    Optional,
+    Self,
+    Type,
+    TypedDict,
+    Union,
+    cast,
+    overload,
+)
 
 import httpx
+import orjson
 from fastapi import HTTPException, status
 from pydantic import BaseModel
 
-from .config import settings
+from .config import _current_loop, get_settings
 from .logger_ import setup_logger
 from .types import (
     ErrorResponse,
@@ -22,8 +42,15 @@ from .types import (
 
 logger = setup_logger()
 
+# Connection pool limits for the HTTP client shared by all SetRequest instances
+_CLIENT_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=100)
+
+# HTTP methods whose request_data is sent as a body rather than as query params
+_BODY_METHODS: frozenset[str] = frozenset({"POST", "PUT", "PATCH"})
 
-class UsersRoutes(str, Enum):
+
+@unique
+class UsersRoutes(StrEnum):
     """Enumeration of available user service routes."""
 
     CREATE_USER = "/users/create"
@@ -36,21 +63,23 @@ class UsersRoutes(str, Enum):
     HEALTH = "/health"
 
 
-class AuthenticationRoutes(str, Enum):
+@unique
+class AuthenticationRoutes(StrEnum):
     """Enumeration of available authentication service routes."""
 
     LOG_IN = "/auth/user/log_in"
     GET_USER_INFO = "/auth/user/info"
 
 
-class ServiceName(str, Enum):
+@unique
+class ServiceName(StrEnum):
     """Available service names for routing."""
 
     USERS = "USERS"
     AUTHENTICATION = "AUTHENTICATION"
 
 
-class _HttpRoutesMethods(str, Enum):
+class _HttpRoutesMethods(StrEnum):
     CREATE_USER = "POST"
     GET_USER_BY_ID = "GET"
     GET_USER_BY_LOGIN = "GET"
@@ -67,6 +96,155 @@ class _HttpRoutesMethods(str, Enum):
 
 RoutesTypes = Union[UsersRoutes, AuthenticationRoutes, RoutesNamespaceTypes]
 
+# Service each route enum belongs to; route enums cannot be subclassed, so an
+# exact type lookup replaces isinstance
+_SERVICE_FOR_ROUTE_ENUM: dict[type, str] = {
+    UsersRoutes: ServiceName.USERS.value,
+    AuthenticationRoutes: ServiceName.AUTHENTICATION.value,
+}
+
+_SERVICE_VALUES: frozenset[str] = frozenset(member.value for member in ServiceName)
+
+RouteFormatter = Callable[[Mapping[str, Any]], str]
+
+
+def _compile_route(template: str) -> Optional[RouteFormatter]:
+    """
+    Pre-parses a route template into a function that substitutes its fields.
+
+    Args:
+        template (str): Route template, e.g. "/users/get/{id}".
+
+    Returns:
+        Optional[RouteFormatter]: Function building the route from a params
+        mapping, or None if the template has no replacement fields.
+    """
+    parsed = list(string.Formatter().parse(template))
+    if all(field is None for _, field, _, _ in parsed):
+        return None
+    if any(
+        spec or conversion or (field and ("." in field or "[" in field))
+        for _, field, spec, conversion in parsed
+    ):
+        return template.format_map
+
+    parts = tuple((literal, field) for literal, field, _, _ in parsed)
+
+    def _format(params: Mapping[str, Any]) -> str:
+        return "".join(
+            literal if field is None else literal + str(params[field])
+            for literal, field in parts
+        )
+
+    return _format
+
+
+# Route key -> expected HTTP method, without enum lookups per request
+_METHOD_FOR_ROUTE: dict[str, str] = {
+    name: member.value for name, member in _HttpRoutesMethods.__members__.items()
+}
+
+# Every route must declare its HTTP method; fail at import rather than per request
+_ROUTES_WITHOUT_METHOD = {
+    route.name for routes in (UsersRoutes, AuthenticationRoutes) for route in routes
+} - _METHOD_FOR_ROUTE.keys()
+if _ROUTES_WITHOUT_METHOD:
+    raise RuntimeError(
+        f"Routes missing from _HttpRoutesMethods: {sorted(_ROUTES_WITHOUT_METHOD)}"
+    )
+
+# URLs are built as base prefix + template, so every template must be absolute
+_RELATIVE_ROUTES = [
+    route.name
+    for routes in (UsersRoutes, AuthenticationRoutes)
+    for route in routes
+    if not route.value.startswith("/")
+]
+if _RELATIVE_ROUTES:
+    raise RuntimeError(f"Route templates must start with '/': {_RELATIVE_ROUTES}")
+
+
+class _RouteSpec(NamedTuple):
+    """Precomputed dispatch data for one route."""
+
+    template: str
+    method: str
+    formatter: Optional[RouteFormatter]  # None for routes without parameters
+    param_names: tuple[str, ...]
+
+
+def _build_route_spec(route: UsersRoutes | AuthenticationRoutes) -> _RouteSpec:
+    """
+    Builds the dispatch entry for a route enum member.
+    """
+    return _RouteSpec(
+        template=route.value,
+        method=_METHOD_FOR_ROUTE[route.name],
+        formatter=_compile_route(route.value),
+        # top-level names only, e.g. "user" for "{user.id}"
+        param_names=tuple(
+            dict.fromkeys(
+                field.partition(".")[0].partition("[")[0]
+                for _, field, _, _ in string.Formatter().parse(route.value)
+                if field is not None
+            )
+        ),
+    )
+
+
+# (service name, route key) -> route spec, built once at import so request
+# dispatch is a single dict lookup
+_ROUTE_TABLE: dict[tuple[str, str], _RouteSpec] = {
+    (service.value, route.name): _build_route_spec(route)
+    for service, routes in (
+        (ServiceName.USERS, UsersRoutes),
+        (ServiceName.AUTHENTICATION, AuthenticationRoutes),
+    )
+    for route in routes
+}
+
+
+def _route_name_key(route_name: RoutesTypes) -> str:
+    """
+    Returns the route key (e.g. "CREATE_USER") for a route member or route key.
+    """
+    if type(route_name) in _SERVICE_FOR_ROUTE_ENUM:
+        return cast(UsersRoutes | AuthenticationRoutes, route_name).name
+    return str(route_name)
+
+
+def _route_key(service: ServiceName | str, route_name: RoutesTypes) -> tuple[str, str]:
+    """
+    Builds the _ROUTE_TABLE key for a service and a route member or route key.
+
+    Raises:
+        ValueError: If a route enum member does not belong to the service.
+    """
+    if isinstance(service, ServiceName):
+        service_value = service.value
+    elif isinstance(service, str):
+        # canonical names skip the upper() copy
+        service_value = service if service in _SERVICE_VALUES else service.upper()
+    else:
+        service_value = str(service).upper()
+
+    route_service = _SERVICE_FOR_ROUTE_ENUM.get(type(route_name))
+    route_key = _route_name_key(route_name)
+    # members share names across enums (e.g. LOG_IN), so never resolve one
+    # against another service's table
+    if route_service is not None and route_service != service_value:
+        logger.error(
+            "Route %s belongs to service %s, not %s",
+            route_key,
+            route_service,
+            service_value,
+        )
+        raise ValueError(
+            f"Route {type(route_name).__name__}.{route_key} belongs to "
+            f"service {route_service}, not {service_value}"
+        )
+    return service_value, route_key
+
 
 class RoutesNamespace:
     """
@@ -83,60 +261,48 @@ class RoutesNamespace:
         route_name: RoutesTypes,
         params: Optional[dict[str, Any]] = None,
     ) -> str:
-        logger.debug(
-            "Getting route for service=%s, route_name=%s, params=%s",
-            service,
-            route_name,
-            params,
-        )
-
-        service_value = (
-            service.value.upper()
-            if isinstance(service, ServiceName)
-            else str(service).upper()
-        )
-        route_service = getattr(cls, service_value, None)
-
-        if route_service is None:
-            logger.error("Unknown service: %s", service)
-            raise ValueError(f"Unknown service: {service}")
-
-        try:
-            if isinstance(route_name, (UsersRoutes, AuthenticationRoutes)):
-                route = str(route_name.value)
-            else:
-                # route_name may be a string key of the enum
-                route = str(route_service[route_name].value)
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug(
+                "Getting route for service=%s, route_name=%s, params=%s",
+                service,
+                route_name,
+                params,
+            )
 
-            logger.debug("Base route template: %s", route)
+        key = _route_key(service, route_name)
+        entry = _ROUTE_TABLE.get(key)
+        if entry is None:
+            if getattr(cls, key[0], None) is None:
+                logger.error("Unknown service: %s", service)
+                raise ValueError(f"Unknown service: {service}")
+            logger.error("Unknown attribute or incorrect format: %s", key)
+            raise ValueError(f"Unknown attribute or incorrect format: {key}")
+
+        route = entry.template
+        if entry.formatter is not None:
+            if not params:
+                logger.error(
+                    "Missing parameters %s for route template: %s",
+                    entry.param_names,
+                    route,
+                )
+                raise ValueError("Missing parameters for route")
 
-            if "{" in route and "}" in route:
-                if not params:
-                    logger.error("Missing parameters for route template: %s", route)
-                    raise ValueError("Missing parameters for route")
+            missing = [name for name in entry.param_names if name not in params]
+            if missing:
+                logger.error("Unknown attribute or incorrect format: %s", missing)
+                raise ValueError(f"Unknown attribute or incorrect format: {missing}")
 
-                logger.debug("Formatting route with parameters: %s", params)
-                route = route.format(**params)
+            route = entry.formatter(params)
 
-            logger.info("Resolved route: %s", route)
-            return route
+        if debug:
+            logger.debug("Resolved route: %s", route)
+        return route
 
-        except AttributeError as exc:
-            logger.error(
-                "Unknown endpoint: %s in service: %s. Error: %s",
-                route_name,
-                service,
-                exc,
-            )
-            raise ValueError(
-                f"Unknown endpoint: {route_name} in service: {service}, {exc}"
-            ) from exc
-        except KeyError as exc:
-            logger.error("Unknown attribute or incorrect format: %s", exc)
-            raise ValueError(f"Unknown attribute or incorrect format: {exc}") from exc
 
-
-class HttpMethods(str, Enum):
+@unique
+class HttpMethods(StrEnum):
     """HTTP methods supported by the API client."""
 
     GET = "GET"
@@ -146,11 +312,59 @@ class HttpMethods(str, Enum):
     PATCH = "PATCH"
 
 
-class ServicesPorts(str, Enum):
-    """Available service ports for routing."""
+@functools.cache
+def _service_ports() -> dict[str, str | int | None]:
+    """
+    Maps each service name to its port, read from the settings on first use,
+    so importing this module does not load the configuration.
+
+    Returns:
+        dict[str, str | int | None]: Port of each service, keyed by its name.
+    """
+    settings_ = get_settings()
+    return {
+        ServiceName.USERS.value: settings_.PORT_SERVICE_USERS,
+        ServiceName.AUTHENTICATION.value: settings_.PORT_SERVICE_AUTH,
+    }
+
+
+# Idempotent GET routes whose successful responses SetRequest may cache
+_CACHEABLE_GET_ROUTES = frozenset(
+    {
+        (ServiceName.USERS.value, UsersRoutes.HEALTH.name),
+        (ServiceName.USERS.value, UsersRoutes.GET_USER_BY_ID.name),
+        (ServiceName.AUTHENTICATION.value, AuthenticationRoutes.GET_USER_INFO.name),
+    }
+)
+_GET_CACHE_MAXSIZE = 1024
+# URL, serialized query and sorted headers of a cached GET request
+_CacheKey = tuple[str, bytes, tuple[tuple[str, str], ...]]
+
+# Full URLs of routes without parameters, filled in by SetRequest._get_url
+_STATIC_URLS: dict[tuple[str, str], str] = {}
+
+
+@functools.cache
+def _base_prefix(service_value: str) -> str:
+    """
+    Returns the scheme, host and port prefix for a service, computed once.
+
+    Args:
+        service_value (str): Upper-case service name, a ServiceName value.
+
+    Returns:
+        str: Base URL joined with the service port, if any.
+
+    Raises:
+        KeyError: If the service has no configured port entry.
+    """
+    service_port = _service_ports()[service_value]
 
-    USERS = settings.PORT_SERVICE_USERS
-    AUTHENTICATION = settings.PORT_SERVICE_AUTH
+    # BASE_URL is already normalized by Settings.validate_base_url
+    base_url = get_settings().BASE_URL
+    if service_port:
+        return f"{base_url}:{service_port}"
+    return base_url
 
 
 class BaseRequestException(HTTPException):
@@ -164,83 +378,265 @@ class BaseRequestException(HTTPException):
         status_code: Optional[int],
         response: Optional[Any] = None,
     ):
-        # Correctly build error_detail string
+        # Callers log the failure before raising, so nothing is logged here
         if message:
             error_detail = message
         else:
             error_detail = f"Error occurred when trying make request: {
                 response if response else 'None response'}"
 
-        logger.error(
-            "BaseRequestException raised: status_code=%s, message=%s, response=%s",
-            status_code,
-            message,
-            response,
-        )
-
         super().__init__(
             detail=error_detail,
             status_code=status_code if status_code else status.HTTP_400_BAD_REQUEST,
         )
 
 
+# Shared HTTP clients, one per event loop: pooled connections are bound to the
+# loop that opened them and cannot be reused once that loop is closed
+_HTTP_CLIENTS: dict[Optional[asyncio.AbstractEventLoop], httpx.AsyncClient] = {}
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Return the HTTP client used by SetRequest in the running event loop.
+
+    The client is created on first call in each event loop with a keep-alive
+    connection pool and reused by every SetRequest instance in that loop, so
+    connections to the services are opened once instead of per instance. A
+    new client is built when the loop changes (e.g. per asyncio.run() call or
+    per test) or after the previous one was closed. Each request passes its
+    own timeout.
+
+    Returns:
+        httpx.AsyncClient: Shared async HTTP client instance
+    """
+    loop = _current_loop()
+    client = _HTTP_CLIENTS.get(loop)
+    if client is None or client.is_closed:
+        # forget clients of loops that have been closed since
+        for stale_loop in [
+            other for other in _HTTP_CLIENTS if other is not None and other.is_closed()
+        ]:
+            del _HTTP_CLIENTS[stale_loop]
+        client = _HTTP_CLIENTS[loop] = httpx.AsyncClient(
+            timeout=10.0, limits=_CLIENT_LIMITS
+        )
+    return client
+
+
+async def close_http_client() -> None:
+    """
+    Close the shared HTTP client of the running event loop and its pool.
+
+    Meant to be awaited on application shutdown (e.g. in a FastAPI lifespan).
+    Does nothing if get_http_client() was never called in this loop; a later
+    get_http_client() call creates a fresh client.
+
+    Example:
+        >>> @asynccontextmanager
+        ... async def lifespan(app: FastAPI):
+        ...     yield
+        ...     await close_http_client()
+    """
+    client = _HTTP_CLIENTS.pop(_current_loop(), None)
+    if client is None:
+        return
+    await client.aclose()
+    logger.info("Shared HTTP client closed")
+
+
+class RequestSpec(TypedDict):
+    """Keyword arguments of a single SetRequest.send_request call."""
+
+    service_name: ServiceName
+    route_name: RoutesTypes
+    route_method: HttpMethods
+    request_data: NotRequired[BaseModel | None]
+    form_data: NotRequired[bool]
+    extra_params: NotRequired[dict[str, Any] | None]
+    url_params: NotRequired[dict[str, Any] | None]
+    headers: NotRequired[dict[str, str] | None]
+
+
+class _Payload(NamedTuple):
+    """Body and query string prepared for one request."""
+
+    json_model: Optional[BaseModel]  # serialized to JSON when sending
+    form: Optional[dict[str, Any]]
+    params: Optional[dict[str, Any]]
+
+
 class SetRequest:
     """
     API client for making HTTP requests to services.
     Handles URL construction, request sending, and error handling.
+
+    Requests go through the pooled client from get_http_client(), shared by
+    all instances running in the same event loop, so creating a SetRequest is
+    cheap. Close the shared client
+    with close_http_client() on application shutdown. A client passed as
+    `client` (e.g. one with a mock transport in tests) is used instead; it
+    belongs to the caller, who must keep it open while the instance is used
+    and close it afterwards.
+
+    With get_cache_ttl > 0, successful responses of the idempotent GET routes
+    (HEALTH, GET_USER_BY_ID, GET_USER_INFO) are reused for that many seconds
+    per URL, query and headers. Cached SuccessResponse objects are shared
+    between callers and must not be mutated.
     """
 
-    def __init__(self, timeout: float = 10.0) -> None:
+    def __init__(
+        self,
+        timeout: float = 10.0,
+        get_cache_ttl: float = 0.0,
+        client: Optional[httpx.AsyncClient] = None,
+    ) -> None:
         self.timeout = timeout
-        self._client: Optional[httpx.AsyncClient] = None
-        logger.info("SetRequest initialized with timeout: %s seconds", timeout)
+        self.get_cache_ttl = get_cache_ttl
+        self._client = client
+        self._get_cache: dict[_CacheKey, tuple[float, SuccessResponse]] = {}
+        logger.debug("SetRequest initialized with timeout: %s seconds", timeout)
 
     async def _ensure_client(self) -> httpx.AsyncClient:
-        if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(timeout=self.timeout)
+        if self._client is None:
+            return get_http_client()
+
+        # never fall back to the shared client behind the caller's back
+        if self._client.is_closed:
+            logger.error("The client passed to SetRequest has been closed")
+            raise RuntimeError("The client passed to SetRequest has been closed")
         return self._client
 
+    async def aclose(self) -> None:
+        """
+        Drops the cached GET responses of this instance.
+
+        No client is closed: an injected client belongs to the caller, and the
+        shared client is closed by close_http_client().
+        """
+        self._get_cache.clear()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        await self.aclose()
+
+    def _cache_response(
+        self,
+        key: Optional[_CacheKey],
+        response: httpx.Response,
+        result: JSONResponseTypes,
+    ) -> None:
+        """
+        Stores a successful GET response until get_cache_ttl expires, unless
+        the service opted out via Cache-Control, bounding cache size.
+        """
+        cache_control = response.headers.get("cache-control", "")
+        if (
+            key is None
+            or not isinstance(result, SuccessResponse)
+            or "no-store" in cache_control
+            or "no-cache" in cache_control
+        ):
+            return
+
+        now = time.monotonic()
+        if len(self._get_cache) >= _GET_CACHE_MAXSIZE:
+            self._get_cache = {
+                cache_key: entry
+                for cache_key, entry in self._get_cache.items()
+                if entry[0] > now
+            }
+            if len(self._get_cache) >= _GET_CACHE_MAXSIZE:
+                # drop the oldest entry
+                del self._get_cache[next(iter(self._get_cache))]
+
+        self._get_cache[key] = (now + self.get_cache_ttl, result)
+
     @staticmethod
-    async def validate_http_method(
-        route_name: RoutesTypes, route_method: HttpMethods
+    def validate_http_method(
+        route_name: RoutesTypes,
+        route_method: HttpMethods,
+        service_name: ServiceName | str | None = None,
     ) -> None:
         """
         Validates if the given HTTP method is allowed for the specified route.
+
+        When service_name is given the expected method comes straight from the
+        precomputed route table; otherwise it is looked up in _METHOD_FOR_ROUTE.
+
+        Raises:
+            BaseRequestException: 404 if the service is unknown or has no such
+                route.
+            ValueError: If the route expects a different HTTP method.
         """
-        logger.debug("Validating HTTP method %s for route %s", route_method, route_name)
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug(
+                "Validating HTTP method %s for route %s", route_method, route_name
+            )
 
-        try:
-            # get route key name (like CREATE_USER)
-            if isinstance(route_name, (UsersRoutes, AuthenticationRoutes)):
-                route_name_str = route_name.name
-            else:
-                # if route_name passed as string key already
-                route_name_str = str(route_name)
-
-            expected_method = getattr(_HttpRoutesMethods, route_name_str).value
-            if expected_method != route_method.value:
-                logger.error(
-                    "HTTP method validation failed: got %s, expected %s for route %s",
-                    route_method.value,
-                    expected_method,
-                    route_name_str,
+        if service_name is not None:
+            try:
+                service_value, route_name_str = _route_key(service_name, route_name)
+            except ValueError as exc:
+                raise BaseRequestException(
+                    message=str(exc), status_code=status.HTTP_404_NOT_FOUND
+                ) from exc
+
+            entry = _ROUTE_TABLE.get((service_value, route_name_str))
+            if entry is None:
+                if service_value not in _SERVICE_VALUES:
+                    logger.error("Unknown service: %s", service_name)
+                    message = f"Unknown service: {service_name}"
+                else:
+                    logger.error(
+                        "Route %s not found for service %s",
+                        route_name_str,
+                        service_value,
+                    )
+                    message = (
+                        f"Route {route_name_str} not found for service {service_value}"
+                    )
+                raise BaseRequestException(
+                    message=message, status_code=status.HTTP_404_NOT_FOUND
                 )
-                # format a simple message
-                raise ValueError(
-                    f"Invalid HTTP method {
-                        route_method.value
-                    } for route {route_name_str}. Expected: {expected_method}"
+            expected_method = entry.method
+        else:
+            route_name_str = _route_name_key(route_name)
+            table_method = _METHOD_FOR_ROUTE.get(route_name_str)
+            if table_method is None:
+                logger.error("Route not found in _HttpRoutesMethods: %s", route_name)
+                raise BaseRequestException(
+                    message=f"Route {route_name_str} not found in _HttpRoutesMethods",
+                    status_code=status.HTTP_404_NOT_FOUND,
                 )
+            expected_method = table_method
 
-            logger.debug("HTTP method validation passed")
-
-        except AttributeError as exc:
-            logger.error("Route not found in _HttpRoutesMethods: %s", route_name)
+        if expected_method != route_method.value:
+            logger.error(
+                "HTTP method validation failed: got %s, expected %s for route %s",
+                route_method.value,
+                expected_method,
+                route_name_str,
+            )
+            # format a simple message
             raise ValueError(
-                f"Route {route_name} not found in _HttpRoutesMethods"
-            ) from exc
+                f"Invalid HTTP method {
+                    route_method.value
+                } for route {route_name_str}. Expected: {expected_method}"
+            )
+
+        if debug:
+            logger.debug("HTTP method validation passed")
 
-    async def _get_url(
+    def _get_url(
         self,
         service_name: ServiceName | str,
         route_name: RoutesTypes,
@@ -249,28 +645,27 @@ class SetRequest:
         """
         Constructs full URL for the API request.
         """
-        logger.debug(
-            "Constructing URL for service=%s, route=%s, params=%s",
-            service_name,
-            route_name,
-            params,
-        )
-
-        try:
-            service_value = (
-                service_name.value
-                if isinstance(service_name, ServiceName)
-                else str(service_name).upper()
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug(
+                "Constructing URL for service=%s, route=%s, params=%s",
+                service_name,
+                route_name,
+                params,
             )
 
+        key = _route_key(service_name, route_name)
+        static_url = _STATIC_URLS.get(key)
+        if static_url is not None:
+            return static_url
+
+        service_value = key[0]
+
+        try:
             # Resolve route (may raise ValueError)
             route = RoutesNamespace.get_route(
                 service=service_value, route_name=route_name, params=params
             )
-
-            if not route.startswith("/"):
-                route = "/" + route
-
         except Exception as exc:
             logger.error("Failed to get route: %s", exc)
             raise BaseRequestException(
@@ -280,169 +675,204 @@ class SetRequest:
                 status_code=status.HTTP_404_NOT_FOUND,
             ) from exc
 
-        # build base url
-        base_url = settings.BASE_URL
-        if not base_url.startswith(("http://", "https://")):
-            base_url = f"http://{base_url}"
-        base_url = base_url.rstrip("/")
-
         try:
-            service_name_for_port = (
-                service_name.value
-                if isinstance(service_name, ServiceName)
-                else str(service_name).upper()
-            )
-            service_port: str | int = getattr(
-                ServicesPorts, service_name_for_port
-            ).value
-            logger.debug(
-                "Found service port: %s for service: %s",
-                service_port,
-                service_name_for_port,
-            )
-        except AttributeError as exc:
+            prefix = _base_prefix(service_value)
+        except KeyError as exc:
             logger.error("Service port not found for service: %s", service_name)
             raise BaseRequestException(
                 message=f"Service port not found for service {service_name}",
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             ) from exc
 
-        if service_port:
-            final_url = f"{base_url}:{service_port}{route}"
-        else:
-            final_url = f"{base_url}{route}"
+        final_url = f"{prefix}{route}"
+        if _ROUTE_TABLE[key].formatter is None:
+            _STATIC_URLS[key] = final_url
 
-        logger.info("Constructed final URL: %s", final_url)
+        if debug:
+            logger.debug("Constructed final URL: %s", final_url)
         return final_url
 
-    async def send_request(
+    @staticmethod
+    def _prepare_payload(
+        method: str,
+        request_data: BaseModel | None,
+        form_data: bool,
+        extra_params: dict[str, Any] | None,
+    ) -> _Payload:
+        """
+        Splits the request data into a JSON body, a form body and a query string.
+        """
+        json_model: BaseModel | None = None
+        req_json: dict[str, Any] | None = None
+
+        # JSON bodies are serialized straight from the model by pydantic-core;
+        # form bodies and GET queries need the dumped dict
+        if request_data is not None:
+            if method in _BODY_METHODS and not form_data:
+                json_model = request_data
+            elif method == "GET" or method in _BODY_METHODS:
+                req_json = request_data.model_dump(exclude_none=True)
+
+        if method != "GET":
+            form = req_json if req_json and method in _BODY_METHODS else None
+            return _Payload(json_model, form, extra_params or None)
+
+        query_params = {**(req_json or {}), **(extra_params or {})}
+        return _Payload(None, None, query_params or None)
+
+    def _cache_key(
         self,
         service_name: ServiceName,
         route_name: RoutesTypes,
-        route_method: HttpMethods,
-        request_data: BaseModel | None = None,
-        form_data: bool = False,
-        extra_params: dict[str, Any] | None = None,
-        url_params: dict[str, Any] | None = None,
-        headers: dict[str, str] | None = None,
-    ) -> JSONResponseTypes:
+        url: str,
+        query_params: dict[str, Any] | None,
+        headers: dict[str, str] | None,
+    ) -> Optional[_CacheKey]:
         """
-        Sends HTTP request to the specified service endpoint.
+        Builds the GET cache key of a request, or None if it is not cacheable.
         """
-        logger.info(
-            "Sending %s request to service=%s, route=%s, form_data=%s",
-            route_method.value,
-            service_name.value if hasattr(service_name, "value") else service_name,
-            route_name,
-            form_data,
-        )
+        # the method was validated against the route, so every cacheable
+        # route here is requested with GET
+        if (
+            self.get_cache_ttl <= 0
+            or _route_key(service_name, route_name) not in _CACHEABLE_GET_ROUTES
+        ):
+            return None
 
-        if request_data:
-            logger.debug("Request data provided: %s", type(request_data).__name__)
+        try:
+            query = orjson.dumps(query_params, default=str, option=orjson.OPT_SORT_KEYS)
+        except orjson.JSONEncodeError as e:
+            # e.g. non-string keys: the request is still sent, just not cached
+            logger.debug("Not caching %s, query is not serializable: %s", url, e)
+            return None
 
-        await self.validate_http_method(
-            route_name=route_name, route_method=route_method
-        )
+        return url, query, tuple(sorted(headers.items())) if headers else ()
 
-        # Build url with parameters
-        url = await self._get_url(
-            service_name=service_name,
-            route_name=route_name,
-            params=url_params,
-        )
+    def _cached_response(self, key: Optional[_CacheKey]) -> Optional[SuccessResponse]:
+        """
+        Returns the cached response for a key while it has not expired.
+        """
+        if key is None:
+            return None
+        cached = self._get_cache.get(key)
+        if cached is None or cached[0] <= time.monotonic():
+            return None
+        logger.debug("Serving cached response for: %s", key[0])
+        return cached[1]
+
+    @staticmethod
+    def _decode_body(response: httpx.Response) -> Any:
+        """
+        Decodes the JSON body of a response.
+
+        An empty body on a successful response (e.g. 204 No Content) decodes
+        to an empty object. A body that is not JSON raises BaseRequestException
+        with 502 when the service reported success, its own status otherwise.
+        """
+        is_error = response.status_code >= 400
+        if not response.content and not is_error:
+            return {}
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError as e:
+            logger.error("Failed to parse response JSON: %s", e)
+            raise BaseRequestException(
+                message=f"Failed to parse response JSON: {e}",
+                status_code=(
+                    response.status_code if is_error else status.HTTP_502_BAD_GATEWAY
+                ),
+                response=response.text,
+            ) from e
+
+    @staticmethod
+    def _build_response(status_code: int, result: Any) -> JSONResponseTypes:
+        """
+        Wraps a decoded payload into an ErrorResponse or a SuccessResponse.
+        """
+        # checking status response
+        if status_code >= 400:
+            error_message = (
+                result.get("detail", f"HTTP {status_code} error")
+                if isinstance(result, dict)
+                else str(result)
+            )
+            logger.warning(
+                "API returned error response: status_code=%s, detail=%s",
+                status_code,
+                error_message,
+            )
+            return ErrorResponse(error=error_message, status_code=status_code)
 
-        # Init vars for different types
-        json_data = None
-        form_data_dict = None
-        query_params: dict[str, Any] | None = None
-
-        # Get data if request_data
-        req_json = request_data.model_dump(exclude_none=True) if request_data else None
-
-        # preparation data for some methods
-        if route_method.value in ["POST", "PUT", "PATCH"] and req_json:
-            if form_data:
-                form_data_dict = req_json
-            else:
-                json_data = req_json
-
-        # preparation query data
-        if route_method.value == "GET":
-            query_params = {}
-            if req_json:
-                query_params.update(req_json)
-            if extra_params:
-                query_params.update(extra_params)
-            if not query_params:
-                query_params = None
-        elif extra_params:
-            query_params = extra_params
+        # Good response; a decoded JSON object already matches the schema,
+        # so only other payloads go through validation
+        if isinstance(result, dict):
+            return SuccessResponse.model_construct(
+                detail=result, success=True, status_code=status_code
+            )
+        return SuccessResponse(detail=result, success=True, status_code=status_code)
 
+    async def _fetch(
+        self,
+        method: str,
+        url: str,
+        payload: _Payload,
+        headers: dict[str, str] | None,
+    ) -> tuple[httpx.Response, JSONResponseTypes]:
+        """
+        Sends the request and wraps the service's answer, mapping transport
+        failures to BaseRequestException.
+        """
         client = await self._ensure_client()
         try:
-            logger.debug("Making HTTP request to: %s", url)
-            logger.debug("Query params: %s", query_params)
-            logger.debug("JSON data: %s", json_data)
-            logger.debug("Form data: %s", form_data_dict)
+            json_body: Optional[bytes] = None
+            request_headers: httpx.Headers | dict[str, str] | None = headers
+            if payload.json_model is not None:
+                dumped = payload.json_model.model_dump_json(exclude_none=True)
+                # an empty payload sends no body
+                if dumped != "{}":
+                    json_body = dumped.encode()
+                    request_headers = httpx.Headers(headers)
+                    request_headers.setdefault("Content-Type", "application/json")
+
+            logger.debug(
+                "Making HTTP request to: %s, query=%s, json=%s, form=%s",
+                url,
+                payload.params,
+                json_body,
+                payload.form,
+            )
 
             response = await client.request(
-                method=route_method.value,
+                method=method,
                 url=url,
-                json=json_data,
-                data=form_data_dict,
-                params=query_params,
-                headers=headers,
+                content=json_body,
+                data=payload.form,
+                params=payload.params,
+                headers=request_headers,
+                timeout=self.timeout,
             )
 
-            logger.info("Received response with status code: %s", response.status_code)
+            logger.debug("Received response with status code: %s", response.status_code)
 
-            # parsing json response
-            try:
-                result = response.json()
-                logger.debug("Response JSON parsed successfully")
-            except Exception as e:
-                logger.error("Failed to parse response JSON: %s", e)
-                raise BaseRequestException(
-                    message=f"Failed to parse response JSON: {e}",
-                    status_code=response.status_code,
-                    response=response.text,
-                ) from e
-
-            # checking status response
-            if response.status_code >= 400:
-                error_message = (
-                    result.get("detail", f"HTTP {response.status_code} error")
-                    if isinstance(result, dict)
-                    else str(result)
-                )
-                logger.warning(
-                    "API returned error response: status_code=%s, detail=%s",
-                    response.status_code,
-                    error_message,
-                )
-                return ErrorResponse(
-                    error=error_message, status_code=response.status_code
-                )
+            result = self._decode_body(response)
+            return response, self._build_response(response.status_code, result)
 
-            # Good response
-            logger.info("Request completed successfully")
-            return SuccessResponse(
-                detail=result, success=True, status_code=response.status_code
-            )
+        except BaseRequestException:
+            raise
 
         except httpx.TimeoutException as e:
             logger.error("Request timed out after %s seconds: %s", self.timeout, e)
             raise BaseRequestException(
                 message=f"Request timed out: {e}",
                 status_code=status.HTTP_504_GATEWAY_TIMEOUT,
-            ) from e
+            ) from None
 
         except httpx.RequestError as e:
             logger.error("Request failed: %s", e)
             raise BaseRequestException(
                 message=f"Request failed: {e}",
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            ) from e
+            ) from None
 
         except Exception as e:
             logger.error("Unexpected error occurred: %s", e)
@@ -450,3 +880,109 @@ class SetRequest:
                 message=f"Unexpected error: {e}",
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             ) from e
+
+    async def send_request(
+        self,
+        service_name: ServiceName,
+        route_name: RoutesTypes,
+        route_method: HttpMethods,
+        request_data: BaseModel | None = None,
+        form_data: bool = False,
+        extra_params: dict[str, Any] | None = None,
+        url_params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> JSONResponseTypes:
+        """
+        Sends HTTP request to the specified service endpoint.
+        """
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Sending %s request to service=%s, route=%s, form_data=%s, data=%s",
+                route_method.value,
+                service_name,
+                route_name,
+                form_data,
+                type(request_data).__name__ if request_data else None,
+            )
+
+        self.validate_http_method(route_name, route_method, service_name)
+        url = self._get_url(service_name, route_name, url_params)
+
+        payload = self._prepare_payload(
+            route_method.value, request_data, form_data, extra_params
+        )
+
+        cache_key = self._cache_key(
+            service_name, route_name, url, payload.params, headers
+        )
+        cached = self._cached_response(cache_key)
+        if cached is not None:
+            return cached
+
+        response, result = await self._fetch(route_method.value, url, payload, headers)
+        self._cache_response(cache_key, response, result)
+        return result
+
+    @overload
+    async def send_many(
+        self,
+        specs: Iterable[RequestSpec],
+        max_concurrency: Optional[int] = None,
+        return_exceptions: Literal[False] = False,
+    ) -> list[JSONResponseTypes]: ...
+
+    @overload
+    async def send_many(
+        self,
+        specs: Iterable[RequestSpec],
+        max_concurrency: Optional[int] = None,
+        *,
+        return_exceptions: Literal[True],
+    ) -> list[JSONResponseTypes | BaseException]: ...
+
+    async def send_many(
+        self,
+        specs: Iterable[RequestSpec],
+        max_concurrency: Optional[int] = None,
+        return_exceptions: bool = False,
+    ) -> list[JSONResponseTypes] | list[JSONResponseTypes | BaseException]:
+        """
+        Sends several requests concurrently over the shared client.
+
+        Args:
+            specs (Iterable[RequestSpec]): send_request keyword arguments, one
+                mapping per request.
+            max_concurrency (Optional[int]): Maximum number of requests in
+                flight at once, at least 1. Defaults to None (no limit).
+            return_exceptions (bool): Return failures in place of their
+                responses instead of raising the first one. Defaults to False.
+
+        Returns:
+            list[JSONResponseTypes] | list[JSONResponseTypes | BaseException]:
+            Responses (or exceptions) in the same order as specs.
+
+        Raises:
+            BaseRequestException: The first request failure, unless
+                return_exceptions is True.
+            ValueError: If max_concurrency is less than 1. Also raised for a
+                spec with an invalid route or HTTP method, unless
+                return_exceptions is True.
+        """
+        if max_concurrency is not None and max_concurrency < 1:
+            logger.error("Invalid max_concurrency: %s", max_concurrency)
+            raise ValueError(
+                f"max_concurrency must be at least 1, got {max_concurrency}"
+            )
+
+        if max_concurrency is None:
+            coros = [self.send_request(**spec) for spec in specs]
+        else:
+            semaphore = asyncio.Semaphore(max_concurrency)
+
+            async def _limited(spec: RequestSpec) -> JSONResponseTypes:
+                async with semaphore:
+                    return await self.send_request(**spec)
+
+            coros = [_limited(spec) for spec in specs]
+
+        return list(await asyncio.gather(*coros, return_exceptions=return_exceptions))
@@ -5,7 +5,7 @@ It provides a shared set of types for use throughout the OpenVerse tools package
 """
 
 from datetime import datetime, timedelta
-from typing import Any, Literal, Optional, TypeAlias, TypeVar, Union
+from typing import Any, Literal, Optional, TypeAlias, TypeVar
 from uuid import UUID
 
 from pydantic import BaseModel, EmailStr, Field
@@ -14,18 +14,18 @@ J = TypeVar("J", bound=BaseModel | dict[Any, Any] | str)
 
 
 # Basic types
-IdType: TypeAlias = Union[str, UUID]  # Unique identifier type for users and tokens
+IdType: TypeAlias = str | UUID  # Unique identifier type for users and tokens
 LoginType: TypeAlias = str  # User login name type
 NameType: TypeAlias = str  # User display name type
 PasswordType: TypeAlias = str  # User password type
-EmailType: TypeAlias = Union[str, EmailStr]  # User email address type
+EmailType: TypeAlias = str | EmailStr  # User email address type
 IsActiveType: TypeAlias = bool  # Indicates if a user is active
 CreatedAtType: TypeAlias = datetime  # Timestamp for creation
 UpdatedAtType: TypeAlias = datetime  # Timestamp for last update
 AccessTokenType: TypeAlias = str  # JWT access token string
-RefreshTokenType: TypeAlias = str  # JWT refresh token string 
+RefreshTokenType: TypeAlias = str  # JWT refresh token string
 TokenType: TypeAlias = Optional[Literal["Bearer"]]  # Token type, usually 'Bearer'
-SubType: TypeAlias = Union[NameType, UUID]  # Subject type for JWT payload
+SubType: TypeAlias = NameType | UUID  # Subject type for JWT payload
 ScopesType: TypeAlias = Optional[list[str]]  # List of scopes/permissions (optional)
 ExpiresType: TypeAlias = timedelta  # Expiration duration
 ExpiresAtType: TypeAlias = datetime  # Expiration timestamp
@@ -113,9 +113,9 @@ AuthenticationRoutesTypes = Literal[
     "GET_USER_INFO",  # Route for retrieving user info from token
 ]
 
-RoutesNamespaceTypes = Union[
-    UsersRoutesTypes, AuthenticationRoutesTypes
-]  # All possible route types
+RoutesNamespaceTypes = (
+    UsersRoutesTypes | AuthenticationRoutesTypes
+)  # All possible route types
 
 
 class ErrorResponse(BaseModel):